@@ -2,11 +2,16 @@
 Gestionnaire de configuration pour GitLab Client
 Sépare la logique de configuration pour réduire la complexité
 """
+import logging
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict
 
 import yaml
 
+logger = logging.getLogger(__name__)
+
 
 class ConfigManager:
     """Gestionnaire de configuration GitLab"""
@@ -23,17 +28,25 @@ class ConfigManager:
             Configuration sous forme de dictionnaire
         """
         try:
-            with open(config_path, encoding='utf-8') as file:
-                config = yaml.safe_load(file)
-            print(f"✅ Configuration chargée depuis: {config_path}")
+            # Clé de cache (mtime, taille) : toute modification du fichier invalide le cache
+            stat = os.stat(config_path)
+            config = ConfigManager._parse_yaml(config_path, stat.st_mtime_ns, stat.st_size)
+            logger.info("✅ Configuration chargée depuis: %s", config_path)
             return config
         except FileNotFoundError:
-            print(f"❌ Fichier de configuration introuvable: {config_path}")
+            logger.error("❌ Fichier de configuration introuvable: %s", config_path)
             raise
         except yaml.YAMLError as e:
-            print(f"❌ Erreur de format YAML: {e}")
+            logger.error("❌ Erreur de format YAML: %s", e)
             raise
 
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _parse_yaml(config_path: str, mtime_ns: int, size: int) -> Dict[Any, Any]:
+        """Parse le fichier YAML une seule fois par version du fichier (résultat partagé, lecture seule)"""
+        with open(config_path, encoding='utf-8') as file:
+            return yaml.safe_load(file)
+
     @staticmethod
     def load_default_config() -> Dict[Any, Any]:
         """
@@ -46,8 +59,8 @@ class ConfigManager:
         config_path = Path(__file__).parent.parent.parent.parent / 'config' / 'config.yaml'
 
         if not config_path.exists():
-            print("❌ Fichier config/config.yaml introuvable")
-            print("💡 Copiez config/config.example.yaml vers config/config.yaml")
+            logger.error("❌ Fichier config/config.yaml introuvable")
+            logger.error("💡 Copiez config/config.example.yaml vers config/config.yaml")
             raise FileNotFoundError(f"Configuration manquante: {config_path}")
 
         return ConfigManager.load_config(str(config_path))
@@ -3,19 +3,22 @@ Client de connexion GitLab - VERSION REFACTORISÉE
 Module principal pour établir et gérer la connexion à GitLab
 Complexité cognitive réduite via séparation des responsabilités
 """
+import logging
 import warnings
 from typing import Optional
 
 import gitlab as python_gitlab
+import requests
 import urllib3
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from ...utils.constants import GITLAB_PER_PAGE, HTTP_CONNECT_RETRIES, HTTP_POOL_MAXSIZE, HTTP_TIMEOUT
 from .config_manager import ConfigManager
 from .gitlab_validator import GitLabValidator
 
-# Supprimer les warnings SSL et de pagination
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-warnings.filterwarnings("ignore", category=UserWarning, module="gitlab")
+logger = logging.getLogger(__name__)
 
 
 class GitLabClient:
@@ -31,6 +34,7 @@ class GitLabClient:
         self.config = None
         self.client = None
         self.is_connected = False
+        self._session: Optional[requests.Session] = None
 
         # Charger les variables d'environnement
         load_dotenv()
@@ -41,6 +45,17 @@ class GitLabClient:
         else:
             self.config = ConfigManager.load_default_config()
 
+        # Sections 'gitlab' et 'extraction' résolues une seule fois (réutilisées à chaque connexion)
+        self._gitlab_config = (self.config or {}).get('gitlab') or {}
+        self._extraction_config = (self.config or {}).get('extraction') or {}
+        if self._gitlab_config.get('silence_warnings', True):
+            self._silence_gitlab_warnings()
+
+    @staticmethod
+    def _silence_gitlab_warnings():
+        """Masque les UserWarning de python-gitlab (pagination, dépréciations)"""
+        warnings.filterwarnings("ignore", category=UserWarning, module="gitlab")
+
     def connect(
         self, url: Optional[str] = None, token: Optional[str] = None
     ) -> python_gitlab.Gitlab:
@@ -59,8 +74,8 @@ class GitLabClient:
         """
         try:
             # Déterminer les paramètres via le validateur
-            gitlab_url = GitLabValidator.determine_url(self.config, url)
-            gitlab_token = GitLabValidator.determine_token(self.config, token)
+            gitlab_url = GitLabValidator.determine_url(self._gitlab_config, url)
+            gitlab_token = GitLabValidator.determine_token(self._gitlab_config, token)
 
             # Créer et tester le client
             self.client = self._create_gitlab_client(gitlab_url, gitlab_token)
@@ -70,14 +85,14 @@ class GitLabClient:
             return self.client
 
         except python_gitlab.GitlabAuthenticationError as e:
-            print(f"❌ Erreur d'authentification GitLab: {e}")
-            print("💡 Vérifiez votre token d'accès")
+            logger.error("❌ Erreur d'authentification GitLab: %s", e)
+            logger.error("💡 Vérifiez votre token d'accès")
             raise
         except python_gitlab.GitlabGetError as e:
-            print(f"❌ Erreur d'accès GitLab: {e}")
+            logger.error("❌ Erreur d'accès GitLab: %s", e)
             raise
         except Exception as e:
-            print(f"❌ Erreur de connexion GitLab: {e}")
+            logger.error("❌ Erreur de connexion GitLab: %s", e)
             raise
 
     def _create_gitlab_client(self, gitlab_url: str, gitlab_token: str) -> python_gitlab.Gitlab:
@@ -91,7 +106,7 @@ class GitLabClient:
         Returns:
             Client GitLab configuré
         """
-        print(f"🔗 Connexion à GitLab: {gitlab_url}")
+        logger.info("🔗 Connexion à GitLab: %s", gitlab_url)
 
         # Validation sécurisée de l'URL
         if not GitLabValidator.validate_url_format(gitlab_url):
@@ -99,27 +114,65 @@ class GitLabClient:
 
         # Configuration SSL basée sur le domaine
         ssl_verify = not GitLabValidator.is_internal_domain(gitlab_url)
+        if not ssl_verify:
+            # Warnings SSL supprimés uniquement pour les domaines internes sans vérification
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        pool_size = self._extraction_config.get('pool_size', HTTP_POOL_MAXSIZE)
+        self._session = self._create_http_session(ssl_verify, pool_size)
         
         return python_gitlab.Gitlab(
             url=gitlab_url,
             private_token=gitlab_token,
             ssl_verify=ssl_verify,
-            timeout=30,
-            retry_transient_errors=True
+            timeout=self._extraction_config.get('timeout', HTTP_TIMEOUT),
+            per_page=GITLAB_PER_PAGE,
+            retry_transient_errors=True,
+            session=self._session
         )
 
+    @staticmethod
+    def _create_http_session(ssl_verify: bool, pool_size: int = HTTP_POOL_MAXSIZE) -> requests.Session:
+        """
+        Crée la session HTTP partagée (connexions keep-alive réutilisées entre les pages)
+        
+        Args:
+            ssl_verify: Vérification des certificats SSL
+            pool_size: Nombre maximal de connexions conservées par hôte
+            
+        Returns:
+            Session requests avec un pool de connexions élargi
+        """
+        # Les erreurs transitoires 429/5xx sont déjà rejouées par python-gitlab
+        # (retry_transient_errors) : on ne rejoue ici que les échecs d'établissement de connexion.
+        # read=False : un timeout de lecture remonte tel quel (ReadTimeout, non rejoué par python-gitlab)
+        retry = Retry(
+            total=HTTP_CONNECT_RETRIES,
+            connect=HTTP_CONNECT_RETRIES,
+            read=False,
+            backoff_factor=0.3,
+            allowed_methods=frozenset(['GET'])
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=pool_size,
+            max_retries=retry
+        )
+        
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.verify = ssl_verify
+        return session
+
     def _test_connection(self):
         """
-        Teste la connexion GitLab
+        Teste la connexion GitLab (un seul appel /user, mis en cache dans client.user)
         """
         try:
+            self.client.auth()  # type: ignore
             current_user = self.client.user  # type: ignore
-            print(f"✅ Connecté en tant que: {current_user.name} ({current_user.username})")
-            
-            # Test d'accès aux ressources
-            projects = self.client.projects.list(owned=True, simple=True, per_page=1)  # type: ignore
-            print(f"🔍 Accès vérifié - {len(projects)} projet(s) accessible(s)")
-            
+            logger.info("✅ Connecté en tant que: %s (%s)", current_user.name, current_user.username)
+
         except python_gitlab.GitlabAuthenticationError:
             raise python_gitlab.GitlabAuthenticationError("Token GitLab invalide ou expiré")
         except python_gitlab.GitlabGetError as e:
@@ -151,8 +204,11 @@ class GitLabClient:
         """Ferme la connexion GitLab proprement"""
         if self.client:
             self.client = None
+        if self._session:
+            self._session.close()
+            self._session = None
         self.is_connected = False
-        print("🔌 Connexion GitLab fermée")
+        logger.info("🔌 Connexion GitLab fermée")
 
     def is_connection_active(self) -> bool:
         """
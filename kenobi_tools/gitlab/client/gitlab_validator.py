@@ -11,12 +11,12 @@ class GitLabValidator:
     """Validateur pour les paramètres GitLab"""
     
     @staticmethod
-    def determine_url(config: Optional[dict], url: Optional[str]) -> str:
+    def determine_url(gitlab_config: dict, url: Optional[str]) -> str:
         """
         Détermine l'URL GitLab à utiliser
         
         Args:
-            config: Configuration chargée
+            gitlab_config: Section 'gitlab' de la configuration chargée
             url: URL fournie explicitement
             
         Returns:
@@ -25,18 +25,18 @@ class GitLabValidator:
         Raises:
             ValueError: Si aucune URL n'est trouvée
         """
-        gitlab_url = url or (config.get('gitlab', {}).get('url') if config else None)
+        gitlab_url = url or gitlab_config.get('url')
         if not gitlab_url:
             raise ValueError("URL GitLab manquante dans la configuration")
         return gitlab_url
 
     @staticmethod
-    def determine_token(config: Optional[dict], token: Optional[str]) -> str:
+    def determine_token(gitlab_config: dict, token: Optional[str]) -> str:
         """
         Détermine le token GitLab à utiliser
         
         Args:
-            config: Configuration chargée
+            gitlab_config: Section 'gitlab' de la configuration chargée
             token: Token fourni explicitement
             
         Returns:
@@ -46,8 +46,8 @@ class GitLabValidator:
             ValueError: Si aucun token valide n'est trouvé
         """
         gitlab_token = (token or
-                      os.getenv('GITLAB_TOKEN') or
-                      (config.get('gitlab', {}).get('token') if config else None))
+                      os.environ.get('GITLAB_TOKEN') or
+                      gitlab_config.get('token'))
 
         if not gitlab_token or gitlab_token.startswith('${'):
             raise ValueError(
@@ -3,82 +3,120 @@ Exporteur Excel pour GitLab - VERSION ULTRA-SIMPLIFIÉE POWER BI
 Export brut sans formatage - Power BI s'occupe de tout !
 Complexité cognitive visée: ≤ 8
 """
+import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Set
 import pandas as pd
 
+from ...utils.excel_utils import ExcelExporter
+
+logger = logging.getLogger(__name__)
+
+# Répertoire d'export par défaut, résolu une seule fois à l'import
+DEFAULT_EXPORT_DIR = Path(__file__).parent.parent.parent.parent / "exports" / "gitlab"
+
 
 class GitLabExcelExporter:
     """Exporteur Excel minimaliste pour Power BI"""
     
+    # Répertoires déjà créés dans ce processus (un seul mkdir par répertoire)
+    _created_dirs: Set[Path] = set()
+    
     def __init__(self, export_dir: Optional[Path] = None):
         """Initialise l'exporteur simple"""
-        if export_dir is None:
-            current_dir = Path(__file__).parent.parent.parent.parent
-            self.export_dir = current_dir / "exports" / "gitlab"
-        else:
-            self.export_dir = Path(export_dir)
+        self.export_dir = DEFAULT_EXPORT_DIR if export_dir is None else Path(export_dir)
         
-        self.export_dir.mkdir(parents=True, exist_ok=True)
+        if self.export_dir not in self._created_dirs:
+            self.export_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(self.export_dir)
     
     def export_users(self, df_users: pd.DataFrame) -> str:
         """Exporte les utilisateurs - VERSION SIMPLE"""
         if df_users.empty:
-            print("⚠️ Aucun utilisateur à exporter")
+            logger.warning("⚠️ Aucun utilisateur à exporter")
             return ""
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = self.export_dir / f"gitlab_users_{timestamp}.xlsx"
         
         # Export basique - Power BI fait le reste
-        df_users.to_excel(filename, sheet_name="Gitlab Users", index=False)
+        ExcelExporter.write_dataframe_streaming(df_users, filename, "Gitlab Users")
         
-        print(f"✅ {len(df_users)} utilisateurs → {filename}")
+        logger.info("✅ %s utilisateurs → %s", len(df_users), filename)
         return str(filename)
     
     def export_groups(self, df_groups: pd.DataFrame) -> str:
         """Exporte les groupes - VERSION SIMPLE"""
         if df_groups.empty:
-            print("⚠️ Aucun groupe à exporter")
+            logger.warning("⚠️ Aucun groupe à exporter")
             return ""
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = self.export_dir / f"gitlab_groups_{timestamp}.xlsx"
         
-        df_groups.to_excel(filename, sheet_name="Gitlab Groups", index=False)
+        ExcelExporter.write_dataframe_streaming(df_groups, filename, "Gitlab Groups")
         
-        print(f"✅ {len(df_groups)} groupes → {filename}")
+        logger.info("✅ %s groupes → %s", len(df_groups), filename)
         return str(filename)
     
     def export_projects(self, df_projects: pd.DataFrame, project_type: str = "projects") -> str:
         """Exporte les projets - VERSION SIMPLE"""
         if df_projects.empty:
-            print(f"⚠️ Aucun projet {project_type} à exporter")
+            logger.warning("⚠️ Aucun projet %s à exporter", project_type)
             return ""
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = self.export_dir / f"gitlab_{project_type}_{timestamp}.xlsx"
         sheet_name = f"Gitlab {project_type.title()}"
         
-        df_projects.to_excel(filename, sheet_name=sheet_name, index=False)
+        ExcelExporter.write_dataframe_streaming(df_projects, filename, sheet_name)
         
-        print(f"✅ {len(df_projects)} projets {project_type} → {filename}")
+        logger.info("✅ %s projets %s → %s", len(df_projects), project_type, filename)
         return str(filename)
     
     def export_events(self, df_events: pd.DataFrame) -> str:
         """Exporte les événements - VERSION SIMPLE"""
         if df_events.empty:
-            print("⚠️ Aucun événement à exporter")
+            logger.warning("⚠️ Aucun événement à exporter")
             return ""
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = self.export_dir / f"gitlab_events_{timestamp}.xlsx"
         
-        df_events.to_excel(filename, sheet_name="Gitlab Events", index=False)
+        ExcelExporter.write_dataframe_streaming(df_events, filename, "Gitlab Events")
         
-        print(f"✅ {len(df_events)} événements → {filename}")
+        logger.info("✅ %s événements → %s", len(df_events), filename)
         return str(filename)
+    
+    def export_all(
+        self, datasets: Dict[str, pd.DataFrame], sheet_name: str = "Sheet1"
+    ) -> Dict[str, str]:
+        """
+        Exporte plusieurs jeux de données en une fois (un fichier par jeu, horodatage commun)
+        
+        Args:
+            datasets: DataFrames indexés par nom court (ex: 'users', 'active_projects')
+            sheet_name: Nom de la feuille de chaque fichier ("Sheet1", comme to_excel,
+                pour ne pas casser les requêtes Power BI existantes)
+            
+        Returns:
+            Chemins des fichiers créés, indexés par nom court
+        """
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        exported = {}
+        
+        for name, df in datasets.items():
+            if df is None or df.empty:
+                continue
+            
+            filename = self.export_dir / f"gitlab_{name}_{timestamp}.xlsx"
+            ExcelExporter.write_dataframe_streaming(df, filename, sheet_name)
+            
+            logger.info("✅ %s lignes %s → %s", len(df), name, filename)
+            exported[name] = str(filename)
+        
+        return exported
 
 
 # Version encore plus simple pour usage direct
@@ -87,5 +125,5 @@ def quick_export_to_excel(df: pd.DataFrame, filename: str) -> str:
     if df.empty:
         return ""
     
-    df.to_excel(filename, index=False)
+    ExcelExporter.write_dataframe_streaming(df, filename, "Sheet1")
     return filename
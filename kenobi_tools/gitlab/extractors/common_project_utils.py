@@ -3,10 +3,18 @@ Utilitaires communs pour l'extraction des projets GitLab - VERSION ULTRA-SIMPLIF
 Une seule fonction simple pour Power BI
 Complexité cognitive visée: ≤ 8
 """
+from typing import Any, Dict, List, Tuple
+
 import pandas as pd
 import gitlab as python_gitlab
+from ...utils.constants import (
+    DATAFRAME_CHUNK_SIZE, GITLAB_PER_PAGE, PROJETS_ARCHIVES_PATH, STATUS_YES
+)
 from ...utils.date_utils import DateFormatter
 
+# Colonnes à faible cardinalité stockées en 'category' (une seule copie de chaque valeur)
+PROJECT_CATEGORY_COLUMNS = ('Visibilité', 'Archivé', 'Langage Principal')
+
 
 def extract_all_projects(gl_client: python_gitlab.Gitlab, include_archived: bool = False) -> pd.DataFrame:
     """
@@ -14,7 +22,7 @@ def extract_all_projects(gl_client: python_gitlab.Gitlab, include_archived: bool
     
     Args:
         gl_client: Client GitLab authentifié
-        include_archived: Inclure les projets archivés
+        include_archived: Inclure les projets archivés (sinon seuls les non archivés sont listés)
         
     Returns:
         DataFrame avec les données brutes pour Power BI
@@ -22,32 +30,50 @@ def extract_all_projects(gl_client: python_gitlab.Gitlab, include_archived: bool
     try:
         print(f"🔍 Extraction projets (archivés: {'Oui' if include_archived else 'Non'})...")
         
-        # Récupération des projets
-        projects = gl_client.projects.list(all=True, archived=include_archived)
+        # Sans filtre 'archived', l'API renvoie actifs et archivés en une seule énumération
+        archive_filter = {} if include_archived else {'archived': False}
         
-        if not projects:
+        # Récupération paginée à la volée (keyset: pages en O(1) côté serveur)
+        projects = gl_client.projects.list(
+            iterator=True,
+            **archive_filter,
+            per_page=GITLAB_PER_PAGE,
+            pagination='keyset',
+            order_by='id',
+            sort='asc'
+        )
+        
+        # Construction colonne par colonne (dict de listes) par tranches pour Power BI
+        frames = []
+        columns = {
+            'id Projet': [],
+            'Nom': [],
+            'Nom Complet': [],
+            'Description': [],
+            'Visibilité': [],
+            'Archivé': [],
+            'Date Création': [],
+            'Date Dernière Activité': [],
+            'URL Web': [],
+            'Langage Principal': [],
+            'Étoiles': [],
+            'Forks': []
+        }
+        for project in projects:
+            _append_project_row(columns, project)
+            
+            if len(columns['id Projet']) >= DATAFRAME_CHUNK_SIZE:
+                _flush_columns(columns, frames)
+        
+        if columns['id Projet']:
+            _flush_columns(columns, frames)
+        
+        if not frames:
             print("⚠️ Aucun projet trouvé")
             return pd.DataFrame()
         
-        # Construction des données brutes pour Power BI
-        data = []
-        for project in projects:
-            data.append({
-                'id Projet': project.id,
-                'Nom': project.name,
-                'Nom Complet': project.path_with_namespace,
-                'Description': getattr(project, 'description', '') or '',
-                'Visibilité': project.visibility,
-                'Archivé': 'Oui' if getattr(project, 'archived', False) else 'Non',
-                'Date Création': project.created_at,
-                'Date Dernière Activité': project.last_activity_at,
-                'URL Web': project.web_url,
-                'Langage Principal': getattr(project, 'default_branch', ''),
-                'Étoiles': getattr(project, 'star_count', 0),
-                'Forks': getattr(project, 'forks_count', 0)
-            })
-        
-        df = pd.DataFrame(data)
+        df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        df = df.astype(dict.fromkeys(PROJECT_CATEGORY_COLUMNS, 'category'))
         
         if not df.empty:
             # Format dates pour Power BI
@@ -59,3 +85,63 @@ def extract_all_projects(gl_client: python_gitlab.Gitlab, include_archived: bool
     except Exception as e:
         print(f"❌ Erreur extraction projets: {e}")
         return pd.DataFrame()
+
+
+def _append_project_row(columns: Dict[str, List[Any]], project) -> None:
+    """Ajoute les champs d'un projet GitLab à chaque colonne"""
+    # Dict brut de la réponse JSON (évite le __getattr__ de python-gitlab)
+    attrs = project.attributes
+    columns['id Projet'].append(attrs['id'])
+    columns['Nom'].append(attrs['name'])
+    columns['Nom Complet'].append(attrs['path_with_namespace'])
+    columns['Description'].append(attrs.get('description', '') or '')
+    columns['Visibilité'].append(attrs['visibility'])
+    columns['Archivé'].append('Oui' if attrs.get('archived', False) else 'Non')
+    columns['Date Création'].append(attrs['created_at'])
+    columns['Date Dernière Activité'].append(attrs['last_activity_at'])
+    columns['URL Web'].append(attrs['web_url'])
+    columns['Langage Principal'].append(attrs.get('default_branch', ''))
+    columns['Étoiles'].append(attrs.get('star_count', 0))
+    columns['Forks'].append(attrs.get('forks_count', 0))
+
+
+def _flush_columns(columns: Dict[str, List[Any]], frames: List[pd.DataFrame]) -> None:
+    """Convertit la tranche courante en DataFrame et vide les listes pour la suivante"""
+    frames.append(pd.DataFrame(columns))
+    for values in columns.values():
+        values.clear()
+
+
+def build_archived_mask(projects_df: pd.DataFrame) -> pd.Series:
+    """
+    Masque booléen des projets archivés (flag GitLab ou dossier projets-archives/)
+    
+    Args:
+        projects_df: DataFrame produit par extract_all_projects
+        
+    Returns:
+        Série booléenne alignée sur l'index du DataFrame
+    """
+    archived_mask = pd.Series(False, index=projects_df.index)
+    if 'Nom Complet' in projects_df.columns:
+        archived_mask |= projects_df['Nom Complet'].astype(str).str.startswith(PROJETS_ARCHIVES_PATH)
+    if 'Archivé' in projects_df.columns:
+        archived_mask |= projects_df['Archivé'].eq(STATUS_YES)
+    return archived_mask
+
+
+def split_projects_by_archive(projects_df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Sépare une seule extraction de projets en actifs et archivés
+    
+    Args:
+        projects_df: DataFrame produit par extract_all_projects(include_archived=True)
+        
+    Returns:
+        Tuple (projets actifs, projets archivés)
+    """
+    if projects_df.empty:
+        return pd.DataFrame(), pd.DataFrame()
+    
+    archived_mask = build_archived_mask(projects_df)
+    return projects_df[~archived_mask], projects_df[archived_mask]
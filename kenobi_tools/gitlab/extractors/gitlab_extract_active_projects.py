@@ -5,10 +5,8 @@ Refactorisé pour utiliser common_project_utils et éliminer la duplication
 """
 import pandas as pd
 import gitlab as python_gitlab
-from typing import Dict, Any
 
-from .common_project_utils import extract_all_projects
-from ...utils.constants import STATUS_YES, STATUS_NO, PROJETS_ARCHIVES_PATH
+from .common_project_utils import build_archived_mask, extract_all_projects
 
 
 def extract_active_projects(gl_client: python_gitlab.Gitlab) -> pd.DataFrame:
@@ -30,21 +28,8 @@ def extract_active_projects(gl_client: python_gitlab.Gitlab) -> pd.DataFrame:
         print("⚠️ Aucun projet trouvé")
         return pd.DataFrame()
     
-    # Filtrer pour exclure les projets dans projets-archives/
-    active_projects = []
-    
-    for index, project in all_projects_df.iterrows():
-        # Exclure les projets dans le dossier projets-archives/
-        if 'nom_complet' in project and str(project['nom_complet']).startswith(PROJETS_ARCHIVES_PATH):
-            continue
-            
-        # Exclure les projets officiellement archivés (sécurité supplémentaire)
-        if 'etat' in project and project['etat'] == 'Archivé':
-            continue
-            
-        active_projects.append(project)
-    
-    active_df = pd.DataFrame(active_projects)
+    # Filtrer en une seule passe vectorisée (dossier projets-archives/ et projets archivés)
+    active_df = all_projects_df[~build_archived_mask(all_projects_df)]
     
     if not active_df.empty:
         print(f"✅ {len(active_df)} projets actifs extraits")
@@ -5,7 +5,7 @@ Complexité cognitive visée: ≤ 8
 """
 import pandas as pd
 import gitlab as python_gitlab
-from .common_project_utils import extract_all_projects
+from .common_project_utils import build_archived_mask, extract_all_projects
 
 
 def extract_archived_projects(gl_client: python_gitlab.Gitlab) -> pd.DataFrame:
@@ -27,17 +27,11 @@ def extract_archived_projects(gl_client: python_gitlab.Gitlab) -> pd.DataFrame:
         print("⚠️ Aucun projet trouvé")
         return pd.DataFrame()
     
-    # Filtrer uniquement les archivés
-    archive_condition = all_projects_df['archive'] == 'Oui' if 'archive' in all_projects_df.columns else pd.Series([False] * len(all_projects_df))
-    path_condition = all_projects_df['nom_complet'].str.startswith('projets-archives/') if 'nom_complet' in all_projects_df.columns else pd.Series([False] * len(all_projects_df))
+    # Filtrer uniquement les archivés (masque vectorisé partagé avec les projets actifs)
+    archived_mask = build_archived_mask(all_projects_df)
+    archived_df = all_projects_df[archived_mask]
     
-    archived_df = all_projects_df[archive_condition | path_condition].copy()
-    
-    # Assurer que c'est un DataFrame
-    if not isinstance(archived_df, pd.DataFrame):
-        archived_df = pd.DataFrame(archived_df)
-    
-    print(f"✅ {len(archived_df)} projets archivés extraits")
+    print(f"✅ {archived_mask.sum()} projets archivés extraits")
     print("📋 Données prêtes pour Power BI")
     
     return archived_df
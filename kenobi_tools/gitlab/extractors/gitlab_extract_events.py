@@ -4,8 +4,9 @@ Extraction pure sans complexité - Power BI s'en charge !
 Complexité cognitive visée: ≤ 8
 """
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from ...utils.constants import GITLAB_MAX_WORKERS, GITLAB_PER_PAGE
 from ...utils.date_utils import DateFormatter
 
 
@@ -47,21 +48,26 @@ def extract_events_by_project(
 
 
 def _extract_events_from_projects(gl_client, project_ids: list, after_date: datetime) -> list:
-    """Extrait les événements de plusieurs projets"""
-    all_events = []
-    
-    for project_id in project_ids:
-        events = _extract_events_from_single_project(gl_client, project_id, after_date)
-        all_events.extend(events)
+    """Extrait les événements de plusieurs projets (requêtes HTTP en parallèle, ordre conservé)"""
+    if not project_ids:
+        return []
     
-    return all_events
+    max_workers = min(GITLAB_MAX_WORKERS, len(project_ids))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda project_id: _extract_events_from_single_project(gl_client, project_id, after_date),
+            project_ids
+        )
+        return [event for events in results for event in events]
 
 
 def _extract_events_from_single_project(gl_client, project_id: int, after_date: datetime) -> list:
     """Extrait les événements d'un seul projet"""
     try:
         project = gl_client.projects.get(project_id)
-        events = project.events.list(all=True, after=after_date.isoformat())
+        events = project.events.list(
+            iterator=True, after=after_date.isoformat(), per_page=GITLAB_PER_PAGE
+        )
         
         return [_format_event_data(event, project) for event in events]
         
@@ -72,23 +78,19 @@ def _extract_events_from_single_project(gl_client, project_id: int, after_date:
 
 def _format_event_data(event, project) -> dict:
     """Formate les données d'un événement"""
-    author_name = ''
-    author_email = ''
-    
-    if hasattr(event, 'author') and event.author:
-        author_name = event.author.get('name', '')
-        author_email = event.author.get('email', '')
+    attrs = event.attributes
+    author = attrs.get('author') or {}
     
     return {
-        'id Événement': event.id,
-        'Type Action': event.action_name,
-        'Type Cible': getattr(event, 'target_type', ''),
-        'Titre Cible': getattr(event, 'target_title', ''),
-        'Auteur': author_name,
-        'Email Auteur': author_email,
+        'id Événement': attrs['id'],
+        'Type Action': attrs['action_name'],
+        'Type Cible': attrs.get('target_type', ''),
+        'Titre Cible': attrs.get('target_title', ''),
+        'Auteur': author.get('name', ''),
+        'Email Auteur': author.get('email', ''),
         'Nom Projet': project.name,
         'ID Projet': project.id,
-        'Date Création': event.created_at
+        'Date Création': attrs['created_at']
     }
 
 
@@ -5,6 +5,7 @@ Complexité cognitive visée: ≤ 8
 """
 import pandas as pd
 import gitlab as python_gitlab
+from ...utils.constants import GITLAB_PER_PAGE
 from ...utils.date_utils import DateFormatter
 
 
@@ -21,32 +22,40 @@ def extract_groups(gl_client: python_gitlab.Gitlab) -> pd.DataFrame:
     print("👥 Extraction des groupes GitLab...")
     
     try:
-        # Récupération simple sans statistiques
-        groups = gl_client.groups.list(all=True)
+        # Récupération paginée à la volée, sans statistiques
+        groups = gl_client.groups.list(iterator=True, per_page=GITLAB_PER_PAGE)
         
-        if not groups:
-            print("⚠️ Aucun groupe trouvé")
-            return pd.DataFrame()
-        
-        # Construction des données brutes
-        data = []
+        # Construction colonne par colonne (dict de listes)
+        columns = {
+            'id Groupe': [],
+            'Nom': [],
+            'Chemin': [],
+            'Chemin Complet': [],
+            'Description': [],
+            'Visibilité': [],
+            'Date Création': [],
+            'URL Web': []
+        }
         for group in groups:
+            attrs = group.attributes
             # Ignorer les archives
-            if _is_archive_group(group.full_path):
+            if _is_archive_group(attrs['full_path']):
                 continue
-                
-            data.append({
-                'id Groupe': group.id,
-                'Nom': group.name,
-                'Chemin': group.path,
-                'Chemin Complet': group.full_path,
-                'Description': getattr(group, 'description', '') or '',
-                'Visibilité': group.visibility,
-                'Date Création': group.created_at,
-                'URL Web': group.web_url
-            })
+            
+            columns['id Groupe'].append(attrs['id'])
+            columns['Nom'].append(attrs['name'])
+            columns['Chemin'].append(attrs['path'])
+            columns['Chemin Complet'].append(attrs['full_path'])
+            columns['Description'].append(attrs.get('description', '') or '')
+            columns['Visibilité'].append(attrs['visibility'])
+            columns['Date Création'].append(attrs['created_at'])
+            columns['URL Web'].append(attrs['web_url'])
+        
+        if not columns['id Groupe']:
+            print("⚠️ Aucun groupe trouvé")
+            return pd.DataFrame()
         
-        df = pd.DataFrame(data)
+        df = pd.DataFrame(columns).astype({'Visibilité': 'category'})
         
         if not df.empty:
             # Format dates pour Power BI
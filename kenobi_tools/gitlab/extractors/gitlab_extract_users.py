@@ -3,14 +3,11 @@ Extracteur d'utilisateurs GitLab - VERSION REFACTORISÉE
 Module pour extraire uniquement les vrais utilisateurs (pas les bots/services)
 Complexité cognitive réduite via séparation des responsabilités
 """
-import sys
-from pathlib import Path
-from datetime import datetime
 from typing import Any, Dict, Optional
 
 import gitlab as python_gitlab
 import pandas as pd
-from ...utils.constants import ERROR_EXPORT_FAILED
+from ...utils.constants import GITLAB_PER_PAGE
 
 from kenobi_tools.utils.date_utils import format_gitlab_date
 from kenobi_tools.utils.user_formatter import UserFormatter
@@ -35,17 +32,18 @@ def extract_human_users(
     users_data = []
     
     try:
-        # Récupérer et filtrer les utilisateurs
-        all_users = gl_client.users.list(all=True)
-        total_users = len(all_users)
-        print(f"📊 {total_users} utilisateurs trouvés au total")
+        # Récupérer les utilisateurs page par page, sans matérialiser la liste complète
+        all_users = gl_client.users.list(iterator=True, per_page=GITLAB_PER_PAGE)
+        total_users = 0
 
         # Filtrer et extraire en une seule passe
         for user in all_users:
+            total_users += 1
             user_data = _process_single_user(user, include_blocked)
             if user_data:
                 users_data.append(user_data)
 
+        print(f"📊 {total_users} utilisateurs trouvés au total")
         filtered_users = len(users_data)
         print(f"✅ {filtered_users} utilisateurs humains extraits sur {total_users}")
 
@@ -72,30 +70,32 @@ def _process_single_user(user, include_blocked: bool) -> Optional[Dict[str, Any]
         if not UserClassifier.is_human_user(user):
             return None
 
+        attrs = user.attributes
+
         # Filtrer par état si demandé
-        user_state = getattr(user, 'state', 'active')
+        user_state = attrs.get('state', 'active')
         if not include_blocked and user_state in ['blocked', 'deactivated']:
             return None
 
         # Extraire les informations utilisateur
         return {
-            'id_utilisateur': getattr(user, 'id', 0),
-            'nom_utilisateur': getattr(user, 'username', 'N/A'),
-            'email': getattr(user, 'email', 'N/A'),
-            'nom_complet': UserFormatter.format_name(getattr(user, 'name', None)),
-            'admin': "Oui" if getattr(user, 'is_admin', False) else "Non",
+            'id_utilisateur': attrs.get('id', 0),
+            'nom_utilisateur': attrs.get('username', 'N/A'),
+            'email': attrs.get('email', 'N/A'),
+            'nom_complet': UserFormatter.format_name(attrs.get('name', None)),
+            'admin': "Oui" if attrs.get('is_admin', False) else "Non",
             'etat': UserFormatter.translate_state(user_state),
-            'derniere_activite': format_gitlab_date(getattr(user, 'last_activity_on', None)),
-            'derniere_connexion': format_gitlab_date(getattr(user, 'last_sign_in_at', None)),
-            'date_creation': format_gitlab_date(getattr(user, 'created_at', None)),
-            'confirmation_email': "Oui" if getattr(user, 'confirmed_at', None) else "Non",
-            'projets_crees': getattr(user, 'projects_limit', 0),
-            'identite_externe': "Oui" if getattr(user, 'external', False) else "Non",
-            'organisation': getattr(user, 'organization', '') or 'N/A',
-            'localisation': getattr(user, 'location', '') or 'N/A',
-            'site_web': getattr(user, 'web_url', '') or 'N/A',
-            'theme': getattr(user, 'theme_id', 1),
-            'couleur': getattr(user, 'color_scheme_id', 1)
+            'derniere_activite': format_gitlab_date(attrs.get('last_activity_on', None)),
+            'derniere_connexion': format_gitlab_date(attrs.get('last_sign_in_at', None)),
+            'date_creation': format_gitlab_date(attrs.get('created_at', None)),
+            'confirmation_email': "Oui" if attrs.get('confirmed_at', None) else "Non",
+            'projets_crees': attrs.get('projects_limit', 0),
+            'identite_externe': "Oui" if attrs.get('external', False) else "Non",
+            'organisation': attrs.get('organization', '') or 'N/A',
+            'localisation': attrs.get('location', '') or 'N/A',
+            'site_web': attrs.get('web_url', '') or 'N/A',
+            'theme': attrs.get('theme_id', 1),
+            'couleur': attrs.get('color_scheme_id', 1)
         }
 
     except Exception as e:
@@ -119,13 +119,8 @@ def _create_users_dataframe(users_data: list) -> pd.DataFrame:
 
     df = pd.DataFrame(users_data)
     
-    # Trier par nom d'utilisateur
-    df = df.sort_values('nom_utilisateur', ascending=True)
-    
-    # Réinitialiser l'index
-    df = df.reset_index(drop=True)
-    
-    return df
+    # Trier par nom d'utilisateur (index réinitialisé sans copie supplémentaire)
+    return df.sort_values('nom_utilisateur', ascending=True, ignore_index=True)
 
 
 # Toutes les fonctions statistiques supprimées - Power BI fait tout ça mieux !
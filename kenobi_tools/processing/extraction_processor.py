@@ -4,16 +4,13 @@ Orchestration simple sans statistiques ni complexité
 Complexité cognitive visée: ≤ 10
 """
 from pathlib import Path
-from datetime import datetime
 from typing import Optional
-import pandas as pd
+import gitlab as python_gitlab
 
 from ..gitlab.client.gitlab_client import GitLabClient
 from ..gitlab.extractors.gitlab_extract_users import extract_human_users
 from ..gitlab.extractors.gitlab_extract_groups import extract_groups
-from ..gitlab.extractors.gitlab_extract_active_projects import extract_active_projects
-from ..gitlab.extractors.gitlab_extract_archived_projects import extract_archived_projects
-from ..gitlab.extractors.gitlab_extract_events import extract_events_by_project
+from ..gitlab.extractors.common_project_utils import extract_all_projects, split_projects_by_archive
 from ..gitlab.exporters.gitlab_export_excel import GitLabExcelExporter
 
 
@@ -23,12 +20,15 @@ class ExtractionProcessor:
     def __init__(self):
         self.extracted_data = {}
         
-    def process_all_data(self, exports_dir: Path) -> bool:
+    def process_all_data(
+        self, exports_dir: Path, gl_client: Optional[python_gitlab.Gitlab] = None
+    ) -> bool:
         """
         Traite toutes les données GitLab - VERSION SIMPLIFIÉE
         
         Args:
             exports_dir: Répertoire d'export
+            gl_client: Client GitLab déjà authentifié (optionnel, réutilise sa session HTTP)
             
         Returns:
             True si succès, False sinon
@@ -36,9 +36,8 @@ class ExtractionProcessor:
         print("🚀 Début extraction GitLab simplifiée")
         
         try:
-            # Connexion GitLab
-            client = GitLabClient()
-            gl = client.connect()
+            # Connexion GitLab (uniquement si aucun client n'est fourni)
+            gl = gl_client or GitLabClient().connect()
             
             # Extractions directes
             print("👥 Extraction utilisateurs...")
@@ -47,39 +46,18 @@ class ExtractionProcessor:
             print("👥 Extraction groupes...")
             self.extracted_data['groups'] = extract_groups(gl)
             
-            print("📁 Extraction projets actifs...")
-            self.extracted_data['active_projects'] = extract_active_projects(gl)
+            # Une seule énumération des projets, scindée ensuite en actifs / archivés
+            print("📁 Extraction projets (actifs et archivés)...")
+            active_projects, archived_projects = split_projects_by_archive(
+                extract_all_projects(gl, include_archived=True)
+            )
+            self.extracted_data['active_projects'] = active_projects
+            self.extracted_data['archived_projects'] = archived_projects
+            print(f"✅ {len(active_projects)} projets actifs, {len(archived_projects)} projets archivés")
             
-            print("📦 Extraction projets archivés...")  
-            self.extracted_data['archived_projects'] = extract_archived_projects(gl)
-            
-            # Export Excel direct - utilisation des méthodes existantes
+            # Export Excel - un exporteur partagé, horodatage commun à tous les fichiers
             print("📊 Export Excel...")
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            
-            # Export utilisateurs
-            if not self.extracted_data.get('users', pd.DataFrame()).empty:
-                users_file = exports_dir / f"gitlab_users_{timestamp}.xlsx"
-                self.extracted_data['users'].to_excel(users_file, index=False)
-                print(f"✅ Utilisateurs exportés: {users_file}")
-            
-            # Export groupes  
-            if not self.extracted_data.get('groups', pd.DataFrame()).empty:
-                groups_file = exports_dir / f"gitlab_groups_{timestamp}.xlsx"
-                self.extracted_data['groups'].to_excel(groups_file, index=False)
-                print(f"✅ Groupes exportés: {groups_file}")
-            
-            # Export projets actifs
-            if not self.extracted_data.get('active_projects', pd.DataFrame()).empty:
-                active_file = exports_dir / f"gitlab_active_projects_{timestamp}.xlsx"
-                self.extracted_data['active_projects'].to_excel(active_file, index=False)
-                print(f"✅ Projets actifs exportés: {active_file}")
-                
-            # Export projets archivés
-            if not self.extracted_data.get('archived_projects', pd.DataFrame()).empty:
-                archived_file = exports_dir / f"gitlab_archived_projects_{timestamp}.xlsx"
-                self.extracted_data['archived_projects'].to_excel(archived_file, index=False)
-                print(f"✅ Projets archivés exportés: {archived_file}")
+            GitLabExcelExporter(exports_dir).export_all(self.extracted_data)
             
             return True
             
@@ -47,52 +47,56 @@ class MenuComponents:
     @staticmethod
     def show_welcome_banner():
         """Bannière d'accueil moderne sans bordures"""
-        print("\n\n")
-        print("           🎭 MAESTRO KENOBI")
-        print("        GitLab DevSecOps Engine")
-        print("")
-        print(f"    🕒 {datetime.now().strftime('%d/%m/%Y à %H:%M:%S')}  ⚡ v2.0  🎯 Ready")
-        print("    " + "─" * 45)
-        print("\n\n")
+        print("\n".join((
+            "\n\n",
+            "           🎭 MAESTRO KENOBI",
+            "        GitLab DevSecOps Engine",
+            "",
+            f"    🕒 {datetime.now().strftime('%d/%m/%Y à %H:%M:%S')}  ⚡ v2.0  🎯 Ready",
+            "    " + "─" * 45,
+            "\n\n",
+        )))
 
     @staticmethod
     def show_main_menu() -> str:
         """Menu principal fluide sans bordures"""
-        print("           MODES D'EXTRACTION")
-        print("    " + "─" * 35)
-        print("\n")
-
-        print("    🚀 MODE COMPLET                    [Recommandé]")
-        print("       ├─ 👥 Utilisateurs & Groupes")
-        print("       ├─ 📁 Projets (actifs + archivés)")
-        print("       ├─ 📊 Événements avec période configurable")
-        print("       └─ ⏱️  Durée: 5-20 minutes")
-        print("\n")
-
-        print("    ⚙️  MODE PERSONNALISÉ                  [Avancé]")
-        print("       ├─ 🎛️  Sélection modulaire des données")
-        print("       ├─ 🔧 Contrôle fin des extracteurs")
-        print("       └─ ⏱️  Durée: Variable selon sélection")
-        print("\n")
-        print("    " + "─" * 43)
-        print("")
+        print("\n".join((
+            "           MODES D'EXTRACTION",
+            "    " + "─" * 35,
+            "\n",
+            "    🚀 MODE COMPLET                    [Recommandé]",
+            "       ├─ 👥 Utilisateurs & Groupes",
+            "       ├─ 📁 Projets (actifs + archivés)",
+            "       ├─ 📊 Événements avec période configurable",
+            "       └─ ⏱️  Durée: 5-20 minutes",
+            "\n",
+            "    ⚙️  MODE PERSONNALISÉ                  [Avancé]",
+            "       ├─ 🎛️  Sélection modulaire des données",
+            "       ├─ 🔧 Contrôle fin des extracteurs",
+            "       └─ ⏱️  Durée: Variable selon sélection",
+            "\n",
+            "    " + "─" * 43,
+            "",
+        )))
 
         return MenuComponents._get_menu_choice(["1", "2"], "🎯 Votre choix (1 ou 2) ► ")
 
     @staticmethod
     def show_events_period_menu() -> Dict[str, Any] | None:
         """Menu de choix de période simplifié"""
-        print("\n")
-        print("       📅 PÉRIODE DES ÉVÉNEMENTS GITLAB")
-        print("    " + "─" * 35)
-        print("")
-        print("    1️⃣ Les 30 derniers jours")
-        print("    2️⃣ Les 3 derniers mois")
-        print("    3️⃣ Année " + str(datetime.now().year))
-        print("    4️⃣ Tous les événements disponibles")
-        print("")
-        print("    " + "─" * 43)
-        print("")
+        print("\n".join((
+            "\n",
+            "       📅 PÉRIODE DES ÉVÉNEMENTS GITLAB",
+            "    " + "─" * 35,
+            "",
+            "    1️⃣ Les 30 derniers jours",
+            "    2️⃣ Les 3 derniers mois",
+            "    3️⃣ Année " + str(datetime.now().year),
+            "    4️⃣ Tous les événements disponibles",
+            "",
+            "    " + "─" * 43,
+            "",
+        )))
 
         choice = MenuComponents._get_menu_choice(
             list(MenuComponents.EVENT_PERIODS.keys()),
@@ -113,24 +117,28 @@ class MenuComponents:
     @staticmethod
     def show_custom_menu() -> Dict[str, Any]:
         """Menu personnalisé fluide sans bordures"""
-        print("\n")
-        print("            MODE PERSONNALISÉ")
-        print("    " + "─" * 30)
-        print("\n")
-        print("    📊 DONNÉES DE BASE (obligatoires)")
-        print("       • 👥 Utilisateurs GitLab (~30s)")
-        print("       • 🏢 Groupes et sous-groupes (~20s)")
-        print("       • 📁 Projets actifs + archivés (~45s)")
-        print("\n")
-        print("    📈 DONNÉES D'ACTIVITÉ (optionnelles)")
-        print("       • 🔄 Événements GitLab (2-30min)")
-        print("         Push, merge, issues, commentaires...")
-        print("\n")
+        print("\n".join((
+            "\n",
+            "            MODE PERSONNALISÉ",
+            "    " + "─" * 30,
+            "\n",
+            "    📊 DONNÉES DE BASE (obligatoires)",
+            "       • 👥 Utilisateurs GitLab (~30s)",
+            "       • 🏢 Groupes et sous-groupes (~20s)",
+            "       • 📁 Projets actifs + archivés (~45s)",
+            "\n",
+            "    📈 DONNÉES D'ACTIVITÉ (optionnelles)",
+            "       • 🔄 Événements GitLab (2-30min)",
+            "         Push, merge, issues, commentaires...",
+            "\n",
+        )))
 
         # Choix avec confirmation visuelle
-        print("    🎯 Configuration:")
-        print("       ✅ Données de base: Incluses automatiquement")
-        print("")
+        print("\n".join((
+            "    🎯 Configuration:",
+            "       ✅ Données de base: Incluses automatiquement",
+            "",
+        )))
 
         events_choice = MenuComponents._get_yes_no_choice(
             "📈 Inclure les événements ? (o/n) ► "
@@ -153,20 +161,24 @@ class MenuComponents:
     @staticmethod
     def show_complete_mode_steps(events_config: Dict[str, Any] | None) -> bool:
         """Affichage des étapes du mode complet avec confirmation"""
-        print("\n\n")
-        print("        🚀 MODE COMPLET SÉLECTIONNÉ")
-        print("    " + "─" * 35)
-        print("")
+        print("\n".join((
+            "\n\n",
+            "        🚀 MODE COMPLET SÉLECTIONNÉ",
+            "    " + "─" * 35,
+            "",
+        )))
 
         # Étape 2: Affichage du récapitulatif
-        print("\n    📋 Récapitulatif de configuration")
-        print("        ✅ Configuration choisie")
-        print("    " + "─" * 30)
-        print("")
-        print("      📊 Données: Base + Activité")
-        print("         • 👥 Utilisateurs")
-        print("         • 🏢 Groupes")
-        print("         • 📁 Projets (actifs + archivés)")
+        print("\n".join((
+            "\n    📋 Récapitulatif de configuration",
+            "        ✅ Configuration choisie",
+            "    " + "─" * 30,
+            "",
+            "      📊 Données: Base + Activité",
+            "         • 👥 Utilisateurs",
+            "         • 🏢 Groupes",
+            "         • 📁 Projets (actifs + archivés)",
+        )))
         if events_config:
             print(f"         • 📅 Événements: {events_config['name']}")
         else:
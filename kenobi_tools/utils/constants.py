@@ -3,29 +3,43 @@
 Constantes globales pour éviter la duplication de code
 Identifiées par SonarCloud pour améliorer la maintenabilité
 """
+from typing import Final
 
 # Formats de date standardisés
-DATE_FORMAT_FRENCH = "%d/%m/%Y %H:%M:%S"
-DATE_FORMAT_ISO_Z = "%Y-%m-%dT%H:%M:%SZ"
+DATE_FORMAT_FRENCH: Final[str] = "%d/%m/%Y %H:%M:%S"
+DATE_FORMAT_ISO_Z: Final[str] = "%Y-%m-%dT%H:%M:%SZ"
 
 # Chemins d'export
-EXPORTS_GITLAB_PATH = "exports/gitlab"
+EXPORTS_GITLAB_PATH: Final[str] = "exports/gitlab"
 
 # Messages d'erreur standardisés
-ERROR_EXPORT_FAILED = "\n❌ Export échoué!"
+ERROR_EXPORT_FAILED: Final[str] = "\n❌ Export échoué!"
 
 # Status de projet - labels français
-PROJET_ARCHIVE_STATUS = "archivé"
-PROJETS_ARCHIVES_PATH = "projets-archives/"
-ERROR_EXTRACTION_FAILED = "❌ Erreur lors de l'extraction"
+PROJETS_ARCHIVES_PATH: Final[str] = "projets-archives/"
+ERROR_EXTRACTION_FAILED: Final[str] = "❌ Erreur lors de l'extraction"
 
 # Statuts de projets
-STATUS_ARCHIVED = "archivé"
-STATUS_YES = "Oui"
-STATUS_NO = "Non"
+STATUS_ARCHIVED: Final[str] = "archivé"
+STATUS_YES: Final[str] = "Oui"
+STATUS_NO: Final[str] = "Non"
 
 # Messages de succès
-SUCCESS_EXTRACTION = "✅ Extraction terminée avec succès"
+SUCCESS_EXTRACTION: Final[str] = "✅ Extraction terminée avec succès"
 
 # Configuration par défaut
-DEFAULT_EXCEL_ENGINE = "openpyxl"
+DEFAULT_EXCEL_ENGINE: Final[str] = "openpyxl"
+
+# Pagination API GitLab (maximum accepté par le serveur, défaut: 20)
+GITLAB_PER_PAGE: Final[int] = 100
+
+# Pool de connexions HTTP partagé par le client GitLab
+HTTP_POOL_MAXSIZE: Final[int] = 32
+HTTP_CONNECT_RETRIES: Final[int] = 3
+HTTP_TIMEOUT: Final[int] = 30
+
+# Requêtes GitLab concurrentes pour les extractions projet par projet
+GITLAB_MAX_WORKERS: Final[int] = 8
+
+# Lignes accumulées avant conversion en DataFrame (mémoire bornée)
+DATAFRAME_CHUNK_SIZE: Final[int] = 1000
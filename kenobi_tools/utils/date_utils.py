@@ -5,7 +5,7 @@ Module pour la gestion des dates avec complexité réduite
 
 import pandas as pd
 from datetime import datetime
-from typing import Union, Optional
+from typing import Union
 
 from .constants import DATE_FORMAT_FRENCH
 
@@ -28,25 +28,12 @@ class DateFormatter:
             return "N/A"
         
         try:
-            # Si c'est déjà un datetime
+            # datetime ou pd.Timestamp (sous-classe de datetime)
             if isinstance(date_input, datetime):
                 return date_input.strftime(DATE_FORMAT_FRENCH)
             
-            # Si c'est un pd.Timestamp
-            if isinstance(date_input, pd.Timestamp):
-                return date_input.strftime(DATE_FORMAT_FRENCH)
-            
-            # Convertir string au format ISO vers datetime
-            date_str = str(date_input).strip()
-            
-            # Supporter les formats GitLab courants
-            if date_str.endswith('Z'):
-                dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            elif 'T' in date_str:
-                dt = datetime.fromisoformat(date_str)
-            else:
-                # Essayer un parsing direct
-                dt = datetime.fromisoformat(date_str)
+            # fromisoformat (Python ≥ 3.11) gère directement le suffixe 'Z' de GitLab
+            dt = datetime.fromisoformat(str(date_input).strip())
             
             return dt.strftime(DATE_FORMAT_FRENCH)
             
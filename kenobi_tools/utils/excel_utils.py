@@ -3,15 +3,25 @@ Utilitaires Excel simplifiés - VERSION REFACTORISÉE
 Module centralisé pour l'export Excel avec complexité réduite
 """
 
+import io
 import os
 from datetime import datetime
-from typing import Optional
 
 import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
 from openpyxl.utils import get_column_letter
 
 from .constants import EXPORTS_GITLAB_PATH
 
+# Style d'en-tête identique à celui de pandas.to_excel (gras, bordures fines, centré),
+# créé une seule fois et partagé par toutes les cellules d'en-tête
+_THIN_SIDE = Side(style="thin")
+_HEADER_FONT = Font(bold=True)
+_HEADER_BORDER = Border(left=_THIN_SIDE, right=_THIN_SIDE, top=_THIN_SIDE, bottom=_THIN_SIDE)
+_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="top")
+
 
 class ExcelExporter:
     """Exporteur Excel simplifié"""
@@ -45,15 +55,10 @@ class ExcelExporter:
             # Créer le répertoire de sortie
             output_path = ExcelExporter._ensure_output_directory(filename)
             
-            # Export vers Excel
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
-                
-                # Formatage basique
-                worksheet = writer.sheets[sheet_name]
-                ExcelExporter._apply_basic_formatting(
-                    worksheet, enable_autofilter, freeze_first_row
-                )
+            # Export vers Excel (lignes streamées, formatage basique posé avant l'écriture)
+            ExcelExporter.write_dataframe_streaming(
+                df, output_path, sheet_name, enable_autofilter, freeze_first_row
+            )
             
             print(f"✅ Excel exporté: {os.path.basename(output_path)}")
             return output_path
@@ -62,6 +67,58 @@ class ExcelExporter:
             print(f"❌ Erreur export Excel: {e}")
             return ""
     
+    @staticmethod
+    def write_dataframe_streaming(
+        df: pd.DataFrame,
+        output_path,
+        sheet_name: str = "Data",
+        enable_autofilter: bool = False,
+        freeze_first_row: bool = False
+    ) -> None:
+        """
+        Écrit un DataFrame avec openpyxl en mode write_only
+        
+        Les lignes sont streamées (aucun objet Cell conservé), mais l'archive .xlsx compressée
+        est assemblée en mémoire avant d'être écrite sur disque en un seul appel.
+        
+        Args:
+            df: DataFrame à écrire
+            output_path: Chemin du fichier .xlsx
+            sheet_name: Nom de la feuille Excel
+            enable_autofilter: Activer le filtre automatique
+            freeze_first_row: Figer la première ligne
+        """
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet(title=sheet_name)
+        
+        # En mode write_only, le formatage de feuille doit précéder la première ligne
+        if enable_autofilter and not df.empty:
+            max_col_letter = get_column_letter(len(df.columns))
+            worksheet.auto_filter.ref = f"A1:{max_col_letter}{len(df) + 1}"
+        if freeze_first_row:
+            worksheet.freeze_panes = "A2"
+        
+        worksheet.append([ExcelExporter._header_cell(worksheet, column) for column in df.columns])
+        
+        # Valeurs manquantes écrites comme cellules vides (comme to_excel), une seule conversion NumPy
+        for row in df.to_numpy(dtype=object, na_value=None):
+            worksheet.append(row.tolist())
+        
+        # Archive ZIP construite en mémoire puis écrite d'un bloc (évite les petites écritures)
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        with open(output_path, 'wb') as output_file:
+            output_file.write(buffer.getbuffer())
+    
+    @staticmethod
+    def _header_cell(worksheet, value) -> WriteOnlyCell:
+        """Crée une cellule d'en-tête stylée pour une feuille write_only"""
+        cell = WriteOnlyCell(worksheet, value=value)
+        cell.font = _HEADER_FONT
+        cell.border = _HEADER_BORDER
+        cell.alignment = _HEADER_ALIGNMENT
+        return cell
+    
     @staticmethod
     def _ensure_output_directory(filename: str) -> str:
         """S'assure que le répertoire de sortie existe"""
@@ -76,25 +133,6 @@ class ExcelExporter:
         # Créer le répertoire parent si nécessaire
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         return output_path
-    
-    @staticmethod
-    def _apply_basic_formatting(worksheet, enable_autofilter: bool, freeze_first_row: bool):
-        """Applique le formatage de base à la feuille Excel"""
-        if not worksheet or worksheet.max_row <= 1:
-            return
-        
-        try:
-            # Filtre automatique
-            if enable_autofilter:
-                max_col_letter = get_column_letter(worksheet.max_column)
-                worksheet.auto_filter.ref = f"A1:{max_col_letter}{worksheet.max_row}"
-            
-            # Figer la première ligne
-            if freeze_first_row:
-                worksheet.freeze_panes = "A2"
-                
-        except Exception as e:
-            print(f"⚠️ Erreur formatage Excel: {e}")
 
 
 # Fonctions de compatibilité avec l'ancienne API
@@ -2,6 +2,26 @@
 Classification des utilisateurs GitLab
 Sépare la logique de classification pour réduire la complexité cognitive
 """
+import re
+from typing import Tuple
+
+# Patterns de comptes de service (comptes techniques organisationnels)
+SERVICE_PATTERNS = (
+    'deploy', 'service', 'system', 'backup', 'monitoring', 'alert',
+    'scheduler', 'cron', 'batch', 'process', 'gitlabuser', 'sonarqube',
+    'nexus', 'artifactory', 'prometheus', 'grafana', 'kibana', 'elastic',
+    'gitlab-duo', 'gitlabduo', 'duo', 'pic-', 'jks', 'atman_netopia'
+)
+
+# Patterns de bots custom
+BOT_PATTERNS = (
+    'robot', 'ci', 'cd', 'build', 'jenkins', 'gitlab-ci',
+    'admin', 'noreply', 'ghost', 'runner'
+)
+
+# Une seule alternance compilée par famille : un passage par champ au lieu d'un test par pattern
+SERVICE_PATTERN_RE = re.compile('|'.join(map(re.escape, SERVICE_PATTERNS)))
+BOT_PATTERN_RE = re.compile('|'.join(map(re.escape, BOT_PATTERNS)))
 
 
 class UserClassifier:
@@ -23,10 +43,20 @@ class UserClassifier:
         if is_gitlab_bot:
             return "Bot"
         
-        username = getattr(user, 'username', '').lower()
-        name = getattr(user, 'name', '').lower()
-        email = getattr(user, 'email', '').lower()
+        return UserClassifier._classify_fields(*UserClassifier._lowered_fields(user))
+
+    @staticmethod
+    def _lowered_fields(user) -> Tuple[str, str, str]:
+        """Met en minuscules une seule fois les champs utilisés par la classification"""
+        return (
+            getattr(user, 'username', '').lower(),
+            getattr(user, 'name', '').lower(),
+            getattr(user, 'email', '').lower()
+        )
 
+    @staticmethod
+    def _classify_fields(username: str, name: str, email: str) -> str:
+        """Classe un utilisateur à partir de ses champs déjà en minuscules"""
         # Vérifier les patterns de service (comptes techniques organisationnels)
         if UserClassifier._is_service_account(username, name, email):
             return "Service"
@@ -41,28 +71,12 @@ class UserClassifier:
     @staticmethod
     def _is_service_account(username: str, name: str, email: str) -> bool:
         """Vérifie si l'utilisateur est un compte de service"""
-        service_patterns = [
-            'deploy', 'service', 'system', 'backup', 'monitoring', 'alert',
-            'scheduler', 'cron', 'batch', 'process', 'gitlabuser', 'sonarqube',
-            'nexus', 'artifactory', 'prometheus', 'grafana', 'kibana', 'elastic',
-            'gitlab-duo', 'gitlabduo', 'duo', 'pic-', 'jks', 'atman_netopia'
-        ]
-
-        return any(pattern in field 
-                  for pattern in service_patterns 
-                  for field in [username, name, email])
+        return any(SERVICE_PATTERN_RE.search(field) for field in (username, name, email))
 
     @staticmethod
     def _is_bot_account(username: str, name: str, email: str) -> bool:
         """Vérifie si l'utilisateur est un bot"""
-        bot_patterns = [
-            'robot', 'ci', 'cd', 'build', 'jenkins', 'gitlab-ci',
-            'admin', 'noreply', 'ghost', 'runner'
-        ]
-
-        return any(pattern in field 
-                  for pattern in bot_patterns 
-                  for field in [username, name, email])
+        return any(BOT_PATTERN_RE.search(field) for field in (username, name, email))
 
     @staticmethod
     def is_human_user(user) -> bool:
@@ -75,19 +89,21 @@ class UserClassifier:
         Returns:
             True si l'utilisateur est considéré comme humain
         """
-        user_type = UserClassifier.determine_user_type(user)
+        if getattr(user, 'bot', False):
+            return False
+
+        # Champs normalisés une seule fois, réutilisés par tous les filtres
+        username, name, email = UserClassifier._lowered_fields(user)
 
         # Ne garder que les humains
-        if user_type != "Humain":
+        if UserClassifier._classify_fields(username, name, email) != "Humain":
             return False
 
         # Exclure les utilisateurs "ghost" (supprimés)
-        username = getattr(user, 'username', '').lower()
-        if 'ghost' in username or username.startswith('ghost'):
+        if 'ghost' in username:
             return False
 
         # Exclure les comptes techniques avec nom identique au username (sauf prénoms simples)
-        name = getattr(user, 'name', '').lower()
         if username == name and len(username) > 5:  # Éviter d'exclure des prénoms courts
             return False
 
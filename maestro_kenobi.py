@@ -5,13 +5,11 @@ Version simplifiée pour réduire la complexité cognitive
 Délègue les responsabilités aux modules spécialisés
 """
 
-import contextlib
+import logging
 import sys
-import time
 from pathlib import Path
 from typing import Any, Dict
 
-import pandas as pd
 from dotenv import load_dotenv
 
 # Ajouter les dossiers au path
@@ -81,7 +79,7 @@ class MaestroKenobiOrchestrator:
         
         # Phase 1: Données de base
         print("\n🚀 Début de l'extraction complète...")
-        success = self.processor.process_all_data(self.exports_dir)
+        success = self.processor.process_all_data(self.exports_dir, self.gl)
 
         # Phase 2: Événements (si configuré)  
         if events_config and success:
@@ -98,7 +96,7 @@ class MaestroKenobiOrchestrator:
 
         # Données de base (toujours incluses)
         if config["include_base"]:
-            success = self.processor.process_all_data(self.exports_dir)
+            success = self.processor.process_all_data(self.exports_dir, self.gl)
 
         # Événements (si demandés)
         if config["include_events"] and config["events_config"] and success:
@@ -127,12 +125,14 @@ class MaestroKenobiOrchestrator:
     def _finalize_extraction(self, success: bool) -> bool:
         """Finalise l'extraction et affiche le résumé"""
         if success:
-            print("\n" + "=" * 60)
-            print("🎭 MAESTRO KENOBI - EXTRACTION TERMINÉE AVEC SUCCÈS !")
-            print("=" * 60)
-            print("\n✅ Toutes les données ont été extraites et exportées")
-            print(f"📁 Fichiers disponibles dans: {self.exports_dir}")
-            print("\n🎯 Prêt pour import dans Power BI !")
+            print("\n".join((
+                "\n" + "=" * 60,
+                "🎭 MAESTRO KENOBI - EXTRACTION TERMINÉE AVEC SUCCÈS !",
+                "=" * 60,
+                "\n✅ Toutes les données ont été extraites et exportées",
+                f"📁 Fichiers disponibles dans: {self.exports_dir}",
+                "\n🎯 Prêt pour import dans Power BI !",
+            )))
             return True
         else:
             print("\n❌ Extraction échouée - Vérifiez les logs ci-dessus")
@@ -143,6 +143,9 @@ def main():
     # Charger les variables d'environnement
     load_dotenv()
     
+    # Messages des modules (logging) affichés sur stdout, comme les print de la console
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     # Créer et lancer l'orchestrateur
     orchestrator = MaestroKenobiOrchestrator()
     